@@ -3,3 +3,7 @@ from typing import Any, Callable
 class LiteralParser:
     def __init__(self, expected: str) -> None: ...
     def __call__(self, stream: Any, continuation: Any) -> Any: ...
+
+class BoundParser:
+    def __init__(self, parser: Any, binding: Callable[[Any], Any]) -> None: ...
+    def __call__(self, stream: Any, continuation: Any) -> Any: ...
@@ -11,6 +11,7 @@ from .internals import (
     fail,
     fmap,
     literal,
+    memoized,
     none_of,
     one_of,
     try_parser,
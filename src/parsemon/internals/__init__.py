@@ -1,11 +1,14 @@
 from .parser import bind, choose_parser, run
 from .primitives import (
+    LiteralParser,
+    NoneOfParser,
     character,
     end_of_file,
     fail,
     fmap,
     literal,
     look_ahead,
+    memoized,
     none_of,
     one_of,
     try_parser,
@@ -1,4 +1,8 @@
-from parsemon.extensions import primitives, result, trampoline
+import re
+from weakref import WeakKeyDictionary
+
+from parsemon.extensions import result, trampoline
+from parsemon.stream import StringStream
 
 
 def look_ahead(parser):
@@ -6,9 +10,7 @@ def look_ahead(parser):
         reset_point = stream.get_reset_point()
 
         def _reset_stream(stream, parsing_result):
-            if parsing_result.is_failure():
-                reset_point.destroy()
-            else:
+            if not parsing_result.is_failure():
                 stream.reset_stream(reset_point)
             return trampoline.Call(
                 continuation,
@@ -32,8 +34,6 @@ def try_parser(parser):
         def _reset_stream(progressed_stream, parsing_result):
             if parsing_result.is_failure():
                 stream.reset_stream(reset_point)
-            else:
-                reset_point.destroy()
             return trampoline.Call(
                 continuation,
                 stream,
@@ -49,6 +49,57 @@ def try_parser(parser):
     return _wrapped_parser
 
 
+def memoized(parser):
+    """Cache the results of ``parser`` by stream position.
+
+    When the returned parser is applied at a position it has already
+    seen, the recorded result is replayed without running ``parser``
+    again.  This is useful for parsers that are tried repeatedly at the
+    same position, e.g. as a common prefix of several alternatives in a
+    ``choice``.
+
+    Results are cached per input stream, so reusing the returned parser
+    on different inputs is safe.  Memoization trades memory for speed;
+    it is opt-in for exactly that reason.
+    """
+    caches: WeakKeyDictionary = WeakKeyDictionary()
+
+    def memoized_parser(stream, continuation):
+        try:
+            cache = caches[stream]
+        except KeyError:
+            cache = caches[stream] = {}
+        position = stream.position()
+        recorded = cache.get(position)
+        if recorded is not None:
+            end_point, recorded_result = recorded
+            stream.reset_stream(end_point)
+            return trampoline.Call(
+                continuation,
+                stream,
+                recorded_result,
+            )
+
+        def record_result(progressed_stream, parsing_result):
+            cache[position] = (
+                progressed_stream.get_reset_point(),
+                parsing_result,
+            )
+            return trampoline.Call(
+                continuation,
+                progressed_stream,
+                parsing_result,
+            )
+
+        return trampoline.Call(
+            parser,
+            stream,
+            record_result,
+        )
+
+    return memoized_parser
+
+
 def unit(value):
     def parser(stream, cont):
         return trampoline.Call(
@@ -73,24 +124,42 @@ def fail(msg):
     return parser
 
 
+_END_OF_STRING_MESSAGE = "Expected character but found end of string"
+
+
 def character(n: int = 1):
     """Parse exactly n characters, the default is 1."""
+    if n == 1:
+
+        def single_character_parser(stream, cont):
+            read_character = stream.read()
+            if read_character is None:
+                return trampoline.Call(
+                    cont,
+                    stream,
+                    result.failure(
+                        message=_END_OF_STRING_MESSAGE,
+                        position=stream.position(),
+                    ),
+                )
+            return trampoline.Call(
+                cont,
+                stream,
+                result.success(
+                    value=read_character,
+                ),
+            )
+
+        return single_character_parser
 
     def parser(stream, cont):
-        results = []
-        read_count = 0
-        for _ in range(0, n):
-            char_found = stream.read()
-            if not char_found:
-                break
-            read_count += 1
-            results.append(char_found)
-        if read_count < n:
+        read_characters = stream.read_many(n)
+        if len(read_characters) < n:
             return trampoline.Call(
                 cont,
                 stream,
                 result.failure(
-                    message="Expected character but found end of string",
+                    message=_END_OF_STRING_MESSAGE,
                     position=stream.position(),
                 ),
             )
@@ -98,49 +167,111 @@ def character(n: int = 1):
             cont,
             stream,
             result.success(
-                value="".join(results),
+                value=read_characters,
             ),
         )
 
     return parser
 
 
-def literal(expected):
-    """Parses exactly the string given and nothing else.
+class LiteralParser:
+    __slots__ = ("expected", "length", "mismatch_prefix")
 
-    If the parser already fails on the first element, no input will be
-    consumed.
-    """
-    return primitives.LiteralParser(expected)
+    def __init__(self, expected):
+        self.expected = expected
+        self.length = len(expected)
+        self.mismatch_prefix = "Expected `{expected}` but found `".format(
+            expected=expected,
+        )
+
+    def __call__(self, stream, continuation):
+        expected = self.expected
+        if isinstance(stream, StringStream) and stream.content.startswith(
+            expected, stream.position()
+        ):
+            stream.advance(self.length)
+            return trampoline.Call(
+                continuation,
+                stream,
+                result.success(
+                    value=expected,
+                ),
+            )
+        return self._parse_via_read(stream, continuation)
 
+    def _parse_via_read(self, stream, continuation):
+        reset_point = stream.get_reset_point()
+        for expected_character in self.expected:
+            if stream.next() == expected_character:
+                stream.read()
+            else:
+                failure: result.Result = result.failure(
+                    message=self.mismatch_prefix + "{found}`.".format(
+                        found=stream.next()
+                    ),
+                    position=stream.position(),
+                )
+                stream.reset_stream(reset_point)
+                return trampoline.Call(
+                    continuation,
+                    stream,
+                    failure,
+                )
+        return trampoline.Call(
+            continuation,
+            stream,
+            result.success(
+                value=self.expected,
+            ),
+        )
 
-def none_of(chars: str):
-    """Parse any character except the ones in ``chars``
 
-    This parser will fail if it finds a character that is in
-    ``chars``.
+def literal(expected):
+    """Parses exactly the string given and nothing else.
 
+    If the parser fails, no input will be consumed.
     """
+    return LiteralParser(expected)
+
+
+class NoneOfParser:
+    __slots__ = (
+        "forbidden",
+        "end_of_string_message",
+        "mismatch_prefix",
+        "scan_pattern",
+    )
+
+    def __init__(self, chars: str):
+        self.forbidden = frozenset(chars)
+        self.end_of_string_message = (
+            "Expected any char except `{forbidden}` but found end of string".format(
+                forbidden=chars,
+            )
+        )
+        self.mismatch_prefix = (
+            "Expected anything except one of `{forbidden}` but found ".format(
+                forbidden=chars,
+            )
+        )
+        self.scan_pattern = (
+            re.compile("[^{forbidden}]*".format(forbidden=re.escape(chars)))
+            if chars
+            else re.compile("(?s).*")
+        )
 
-    def parser(stream, cont):
+    def __call__(self, stream, cont):
         next_char = stream.next()
         if next_char is None:
             return trampoline.Call(
                 cont,
                 stream,
                 result.failure(
-                    message=" ".join(
-                        [
-                            "Expected any char except `{forbidden}` but found end"
-                            "of string"
-                        ]
-                    ).format(
-                        forbidden=chars,
-                    ),
+                    message=self.end_of_string_message,
                     position=stream.position(),
                 ),
             )
-        if next_char not in chars:
+        if next_char not in self.forbidden:
             read_character = stream.read()
             return trampoline.Call(
                 cont,
@@ -154,21 +285,51 @@ def none_of(chars: str):
                 cont,
                 stream,
                 result.failure(
-                    message=" ".join(
-                        [
-                            "Expected anything except one of `{forbidden}` but"
-                            "found {actual}"
-                        ]
-                    ).format(forbidden=chars, actual=stream.next()),
+                    message=self.mismatch_prefix + next_char,
                     position=stream.position(),
                 ),
             )
 
-    return parser
+    def scan(self, stream, continuation):
+        """Consume every acceptable character at the head of ``stream`` at
+        once.  Only valid for streams that expose their whole content,
+        i.e. StringStream."""
+        match = self.scan_pattern.match(
+            stream.content,
+            stream.position(),
+        )
+        matched = match.group() if match is not None else ""
+        stream.advance(len(matched))
+        return trampoline.Call(
+            continuation,
+            stream,
+            result.success(
+                value=list(matched),
+            ),
+        )
+
+
+def none_of(chars: str):
+    """Parse any character except the ones in ``chars``
+
+    This parser will fail if it finds a character that is in
+    ``chars``.
+
+    """
+    return NoneOfParser(chars)
 
 
 def one_of(expected: str):
     """Parse only characters contained in ``expected``."""
+    accepted = frozenset(expected)
+    end_of_string_message = (
+        "Expected one of `{expected}` but found end of string".format(
+            expected=expected,
+        )
+    )
+    mismatch_prefix = "Expected one of `{expected}` but found ".format(
+        expected=expected,
+    )
 
     def parser(stream, cont):
         next_character = stream.next()
@@ -177,15 +338,11 @@ def one_of(expected: str):
                 cont,
                 stream,
                 result.failure(
-                    message=(
-                        "Expected on of `{expected}` but found end of string".format(
-                            expected=expected
-                        )
-                    ),
+                    message=end_of_string_message,
                     position=stream.position(),
                 ),
             )
-        if next_character in expected:
+        if next_character in accepted:
             read_character = stream.read()
             return trampoline.Call(
                 cont,
@@ -199,10 +356,7 @@ def one_of(expected: str):
                 cont,
                 stream,
                 result.failure(
-                    message=("Expected one of `{expected}` but found {actual}").format(
-                        expected=expected,
-                        actual=stream.next(),
-                    ),
+                    message=mismatch_prefix + next_character,
                     position=stream.position(),
                 ),
             )
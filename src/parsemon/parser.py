@@ -4,9 +4,21 @@ from dataclasses import dataclass
 from functools import reduce
 from typing import Any, List, Type, TypeVar
 
+from parsemon.extensions import result, trampoline
+
 from .coroutine import do
 from .error import FileTooLarge, ParsingFailed
-from .internals import bind, choose_parser, one_of, run, try_parser, unit
+from .internals import (
+    LiteralParser,
+    NoneOfParser,
+    bind,
+    choose_parser,
+    fmap,
+    one_of,
+    run,
+    try_parser,
+    unit,
+)
 from .sourcemap import (
     display_location,
     find_linebreak_indices,
@@ -64,10 +76,36 @@ def choice(
 
 def choices(parser, *parsers):
     """Try the given parsers one at a time until one succeeds"""
-    return reduce(choice, [parser] + list(parsers))
+    all_parsers = [parser] + list(parsers)
+    if all(isinstance(candidate, LiteralParser) for candidate in all_parsers):
+        return _literal_dispatch(all_parsers)
+    return reduce(choice, all_parsers)
+
+
+def _literal_dispatch(literal_parsers):
+    generic_parser = reduce(choice, literal_parsers)
+
+    def dispatch_parser(stream, continuation):
+        if isinstance(stream, StringStream):
+            content = stream.content
+            position = stream.position()
+            for literal_parser in literal_parsers:
+                if content.startswith(literal_parser.expected, position):
+                    stream.advance(literal_parser.length)
+                    return trampoline.Call(
+                        continuation,
+                        stream,
+                        result.success(
+                            value=literal_parser.expected,
+                        ),
+                    )
+        # Let the generic choice chain handle other stream
+        # implementations and produce the combined failure message.
+        return generic_parser(stream, continuation)
+
+    return dispatch_parser
 
 
-@do
 def many(original_parser):
     """Apply a parser 0 or more times
 
@@ -78,20 +116,43 @@ def many(original_parser):
     :param original_parser: this parser will be applied as often as
         possible by the resulting new parser
     """
-    results = []
-
-    while True:
-        current_result = yield choice(
-            try_parser(original_parser), unit(_NO_FURTHER_RESULT)
+    if isinstance(original_parser, NoneOfParser):
+        return _many_character_scan(original_parser)
+    return _many_generic(original_parser)
+
+
+def _many_character_scan(character_parser):
+    generic_parser = _many_generic(character_parser)
+
+    def parser(stream, continuation):
+        if isinstance(stream, StringStream):
+            return character_parser.scan(stream, continuation)
+        return generic_parser(stream, continuation)
+
+    return parser
+
+
+def _many_generic(original_parser):
+    def parser(stream, continuation):
+        results = []
+        while True:
+            reset_point = stream.get_reset_point()
+            stream, parsing_result = run(original_parser, stream)
+            if parsing_result.is_failure():
+                stream.reset_stream(reset_point)
+                break
+            results.append(parsing_result.value)
+        return trampoline.Call(
+            continuation,
+            stream,
+            result.success(
+                value=results,
+            ),
         )
-        if current_result is _NO_FURTHER_RESULT:
-            break
-        else:
-            results.append(current_result)
-    return results
+
+    return parser
 
 
-@do
 def many1(original_parser):
     """Apply a parser 1 or more times
 
@@ -103,7 +164,15 @@ def many1(original_parser):
         resulting parser
 
     """
-    return [(yield original_parser)] + (yield many(original_parser))
+    rest_parser = many(original_parser)
+
+    def _prepend(first_result):
+        return fmap(
+            lambda rest_results: [first_result] + rest_results,
+            rest_parser,
+        )
+
+    return bind(original_parser, _prepend)
 
 
 @do
@@ -150,7 +219,6 @@ def run_parser(
     """Parse string input_string with parser p"""
 
     def render_failure(failure):
-        linebreaks = find_linebreak_indices(input_string)
         line, column = find_location_in_indices(failure.position, linebreaks)
         return "{message} @ {location}".format(
             message=failure.message, location=display_location(line, column)
@@ -158,6 +226,7 @@ def run_parser(
 
     stream, result = run(p, StringStream.from_string(input_string))
     if result.is_failure():
+        linebreaks = find_linebreak_indices(input_string)
         failures = result.get_failures()
         final_message = " OR ".join(map(render_failure, failures))
         raise ParsingFailed(final_message)
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from typing import List
 
 
@@ -9,12 +10,12 @@ def display_location(line, column) -> str:
 
 
 def find_linebreak_indices(document) -> List[int]:
-    def iterate():
-        for (character, index) in zip(document, range(0, len(document))):
-            if character == "\n":
-                yield index
-
-    return list(iterate())
+    indices = []
+    index = document.find("\n")
+    while index >= 0:
+        indices.append(index)
+        index = document.find("\n", index + 1)
+    return indices
 
 
 def find_line_in_indices(index, indices):
@@ -27,21 +28,7 @@ def find_column_in_indices(index, indices):
 
 def find_location_in_indices(index, indices):
     if not indices:
-        line = 1
-        column = index
-    else:
-        length = len(indices)
-        start = 0
-        end = length
-        while True:
-            middle = (start + end) // 2
-            if end - start <= 1:
-                line = middle + (2 if indices[middle] < index else 1)
-                break
-            else:
-                if indices[middle] >= index:
-                    end = middle
-                else:
-                    start = middle
-        column = index - indices[line - 2] - 1
+        return 1, index
+    line = bisect_left(indices, index) + 1
+    column = index - indices[line - 2] - 1
     return line, column
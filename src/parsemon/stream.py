@@ -6,6 +6,8 @@ from typing import Optional, TextIO
 
 
 class Stream(ABC):
+    __slots__ = ("__weakref__",)
+
     @classmethod
     @abstractmethod
     def from_string(the_class, content: str) -> Stream:
@@ -28,39 +30,25 @@ class Stream(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_reset_point(self) -> ResetPoint:
+    def read_many(self, count: int) -> str:
         raise NotImplementedError()
 
     @abstractmethod
-    def reset_stream(self, reset_point: ResetPoint) -> None:
-        pass
-
-
-class ResetPoint(ABC):
-    @abstractmethod
-    def destroy(self) -> None:
-        pass
+    def get_reset_point(self) -> int:
+        raise NotImplementedError()
 
     @abstractmethod
-    def get_position(self) -> int:
+    def reset_stream(self, reset_point: int) -> None:
         pass
 
 
-class StringStreamResetPoint(ResetPoint):
-    def __init__(self, position: int) -> None:
-        self.position = position
-
-    def destroy(self) -> None:
-        pass
-
-    def get_position(self) -> int:
-        return self.position
-
-
 class StringStream(Stream):
+    __slots__ = ("content", "_position", "_length")
+
     def __init__(self, content: str, position: int) -> None:
         self.content = content
         self._position = position
+        self._length = len(content)
 
     @classmethod
     def from_string(cls, content: str) -> StringStream:
@@ -78,34 +66,33 @@ class StringStream(Stream):
             self._position += 1
         return read_char
 
+    def advance(self, count: int) -> None:
+        """Consume ``count`` characters at once without reading them."""
+        self._position += count
+
+    def read_many(self, count: int) -> str:
+        read_characters = self.content[self._position : self._position + count]
+        self._position += len(read_characters)
+        return read_characters
+
     def next(self) -> Optional[str]:
-        try:
+        if self._position < self._length:
             return self.content[self._position]
-        except IndexError:
-            return None
+        return None
 
     def position(self) -> int:
         return self._position
 
-    def get_reset_point(self) -> StringStreamResetPoint:
-        return StringStreamResetPoint(self._position)
-
-    def reset_stream(self, reset_point: ResetPoint) -> None:
-        self._position = reset_point.get_position()
-
-
-class IOStreamResetPoint(ResetPoint):
-    def __init__(self, position: int):
-        self.position = position
-
-    def destroy(self) -> None:
-        pass
+    def get_reset_point(self) -> int:
+        return self._position
 
-    def get_position(self) -> int:
-        return self.position
+    def reset_stream(self, reset_point: int) -> None:
+        self._position = reset_point
 
 
 class IOStream(Stream):
+    __slots__ = ("_peeked_char", "_stream")
+
     def __init__(self, stream: TextIO):
         self._peeked_char: Optional[str] = None
         self._stream = stream
@@ -128,6 +115,16 @@ class IOStream(Stream):
         else:
             return self._stream.read(1) or None
 
+    def read_many(self, count: int) -> str:
+        if count <= 0:
+            return ""
+        read_characters = ""
+        if self._peeked_char:
+            read_characters = self._peeked_char
+            self._peeked_char = None
+            count -= 1
+        return read_characters + self._stream.read(count)
+
     def position(self) -> int:
         return self._stream.tell() + (-1 if self._peeked_char else 0)
 
@@ -137,8 +134,9 @@ class IOStream(Stream):
             result = self._peeked_char
         return result + self._stream.read()
 
-    def get_reset_point(self) -> IOStreamResetPoint:
-        return IOStreamResetPoint(self.position())
+    def get_reset_point(self) -> int:
+        return self.position()
 
-    def reset_stream(self, reset_point: ResetPoint) -> None:
-        self._stream.seek(reset_point.get_position())
+    def reset_stream(self, reset_point: int) -> None:
+        self._peeked_char = None
+        self._stream.seek(reset_point)
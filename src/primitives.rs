@@ -67,8 +67,110 @@ impl LiteralParser {
     }
 }
 
+#[pyclass]
+pub struct BoundParser {
+    parser: Option<PyObject>,
+    binding: Option<PyObject>,
+}
+
+#[pymethods]
+impl BoundParser {
+    #[new]
+    fn new(parser: PyObject, binding: PyObject) -> Self {
+        BoundParser {
+            parser: Some(parser),
+            binding: Some(binding),
+        }
+    }
+
+    fn __call__(
+        &self,
+        py: Python,
+        stream: PyObject,
+        continuation: PyObject,
+    ) -> PyResult<trampoline::Call> {
+        let parser = self.parser.as_ref().unwrap().clone_ref(py);
+        let bind_continuation = BindContinuation {
+            binding: self.binding.as_ref().map(|binding| binding.clone_ref(py)),
+            continuation: Some(continuation),
+        };
+        Ok(trampoline::Call {
+            function: Some(parser),
+            args: Some(PyTuple::new(py, &[stream, bind_continuation.into_py(py)]).into_py(py)),
+            kwargs: None,
+        })
+    }
+
+    fn __traverse__(&self, visit: pyo3::gc::PyVisit) -> std::result::Result<(), pyo3::PyTraverseError> {
+        if let Some(parser) = &self.parser {
+            visit.call(parser)?;
+        }
+        if let Some(binding) = &self.binding {
+            visit.call(binding)?;
+        }
+        Ok(())
+    }
+
+    fn __clear__(&mut self) {
+        self.parser = None;
+        self.binding = None;
+    }
+}
+
+#[pyclass]
+pub struct BindContinuation {
+    binding: Option<PyObject>,
+    continuation: Option<PyObject>,
+}
+
+#[pymethods]
+impl BindContinuation {
+    fn __call__(
+        &self,
+        py: Python,
+        stream: PyObject,
+        previous_result: PyObject,
+    ) -> PyResult<trampoline::Call> {
+        let continuation = self.continuation.as_ref().unwrap().clone_ref(py);
+        let parsing_result: PyRef<result::Result> = previous_result.extract(py)?;
+        if parsing_result.is_failure() {
+            drop(parsing_result);
+            return Ok(trampoline::Call {
+                function: Some(continuation),
+                args: Some(PyTuple::new(py, &[stream, previous_result]).into_py(py)),
+                kwargs: None,
+            });
+        }
+        let value = parsing_result.value(py)?;
+        drop(parsing_result);
+        let next_parser = self.binding.as_ref().unwrap().call1(py, (value,))?;
+        Ok(trampoline::Call {
+            function: Some(next_parser),
+            args: Some(PyTuple::new(py, &[stream, continuation]).into_py(py)),
+            kwargs: None,
+        })
+    }
+
+    fn __traverse__(&self, visit: pyo3::gc::PyVisit) -> std::result::Result<(), pyo3::PyTraverseError> {
+        if let Some(binding) = &self.binding {
+            visit.call(binding)?;
+        }
+        if let Some(continuation) = &self.continuation {
+            visit.call(continuation)?;
+        }
+        Ok(())
+    }
+
+    fn __clear__(&mut self) {
+        self.binding = None;
+        self.continuation = None;
+    }
+}
+
 pub fn initialize_module(module: &PyModule) -> PyResult<()> {
     module.add_class::<LiteralParser>()?;
+    module.add_class::<BoundParser>()?;
+    module.add_class::<BindContinuation>()?;
     Ok(())
 }
 
@@ -25,14 +25,13 @@ impl Result {
         self.failures.len() > 0
     }
 
-    pub fn map_value(&self, py: Python, mapping: PyObject) -> Self {
+    pub fn map_value(&self, py: Python, mapping: PyObject) -> PyResult<Self> {
         match &self.value {
-            Some(old_value) => {
-                let mut other = self.clone();
-                other.value = mapping.call1(py, (old_value,)).ok();
-                other
-            }
-            None => self.clone(),
+            Some(old_value) => Ok(Self {
+                value: Some(mapping.call1(py, (old_value,))?),
+                failures: Vec::new(),
+            }),
+            None => Ok(self.clone()),
         }
     }
 
@@ -61,9 +60,10 @@ impl Result {
     fn __add__(&self, rhs: Result) -> PyResult<Result> {
         if self.is_failure() {
             if rhs.is_failure() {
-                let mut failures = Vec::new();
-                failures.append(&mut self.failures.iter().cloned().collect());
-                failures.append(&mut rhs.failures.iter().cloned().collect());
+                let mut failures =
+                    Vec::with_capacity(self.failures.len() + rhs.failures.len());
+                failures.extend_from_slice(&self.failures);
+                failures.extend(rhs.failures);
                 Ok(Result {
                     value: None,
                     failures,
@@ -1,7 +1,6 @@
 use pyo3::exceptions::PyException;
 use pyo3::gc::PyVisit;
 use pyo3::prelude::*;
-use pyo3::type_object::PyTypeInfo;
 use pyo3::types::{PyDict, PyTuple};
 use pyo3::wrap_pyfunction;
 use pyo3::PyTraverseError;
@@ -27,10 +26,7 @@ impl Call {
         Ok(Self {
             function: Some(function),
             args: Some(args.to_object(py)),
-            kwargs: match kwargs {
-                Some(dict) => Some(dict.to_object(py)),
-                None => Some(PyDict::new(py).to_object(py)),
-            },
+            kwargs: kwargs.map(|dict| dict.to_object(py)),
         })
     }
 
@@ -63,12 +59,10 @@ impl Call {
             )),
         }
     }
-    fn get_kwargs<'py>(&'py self, py: Python<'py>) -> PyResult<&'py PyDict> {
+    fn get_kwargs<'py>(&'py self, py: Python<'py>) -> PyResult<Option<&'py PyDict>> {
         match &self.kwargs {
-            Some(kwargs) => kwargs.extract(py),
-            None => Err(PyException::new_err(
-                "Could not get keyword arguments for trampoline call",
-            )),
+            Some(kwargs) => Ok(Some(kwargs.extract(py)?)),
+            None => Ok(None),
         }
     }
     fn get_function(&self) -> PyResult<&PyObject> {
@@ -114,12 +108,12 @@ fn with_trampoline(
     kwargs: Option<&PyDict>,
 ) -> PyResult<PyObject> {
     let mut object = trampoline.call(args, kwargs)?;
-    while Call::is_type_of(object) {
-        let call_object = object.extract::<Call>()?;
+    while let Ok(call_cell) = object.downcast::<PyCell<Call>>() {
+        let call_object = call_cell.borrow();
         let function = call_object.get_function()?;
         let args = call_object.get_args(py)?;
         let kwargs = call_object.get_kwargs(py)?;
-        object = function.call(py, args, Some(kwargs))?.into_ref(py);
+        object = function.call(py, args, kwargs)?.into_ref(py);
     }
     Ok(object.extract::<Result>()?.value.unwrap())
 }
@@ -78,6 +78,26 @@ def test_that_reading_stream_advances_its_position_by_one(
     assert original_position == stream.position() - 1
 
 
+@given(text=st.text(), count=st.integers(min_value=0, max_value=10))
+def test_that_read_many_yields_a_prefix_of_the_stream(
+    text,
+    count,
+    stream_implementation,
+):
+    stream = stream_implementation.from_string(text)
+    assert stream.read_many(count) == text[:count]
+
+
+@given(text=st.text(min_size=1))
+def test_that_read_many_after_peeking_does_not_duplicate_characters(
+    text,
+    stream_implementation,
+):
+    stream = stream_implementation.from_string(text)
+    stream.next()
+    assert stream.read_many(len(text)) == text
+
+
 @given(stream=strategies.stream(min_size=1))
 def test_that_stream_can_be_reset(stream):
     reset_point = stream.get_reset_point()
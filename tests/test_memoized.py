@@ -0,0 +1,70 @@
+import pytest
+
+from parsemon import (
+    chain,
+    choice,
+    fail,
+    literal,
+    memoized,
+    run_parser,
+    try_parser,
+    unit,
+)
+from parsemon.error import ParsingFailed
+
+
+def counting_parser(parser):
+    invocations = []
+
+    def wrapped_parser(stream, continuation):
+        invocations.append(stream.position())
+        return parser(stream, continuation)
+
+    return wrapped_parser, invocations
+
+
+def test_memoized_parser_parses_like_the_original_one():
+    parser = memoized(literal("abc"))
+    assert run_parser(parser, "abc").value == "abc"
+
+
+def test_memoized_parser_propagates_failures():
+    parser = memoized(literal("abc"))
+    with pytest.raises(ParsingFailed):
+        run_parser(parser, "xyz")
+
+
+def test_memoized_parser_runs_original_parser_only_once_per_position():
+    prefix, invocations = counting_parser(literal("a"))
+    prefix = memoized(prefix)
+    parser = choice(
+        try_parser(chain(prefix, literal("b"))),
+        chain(prefix, literal("c")),
+    )
+    assert run_parser(parser, "ac").value == "c"
+    assert invocations == [0]
+
+
+def test_memoized_parser_runs_again_at_a_different_position():
+    letter, invocations = counting_parser(literal("a"))
+    letter = memoized(letter)
+    parser = chain(letter, letter)
+    assert run_parser(parser, "aa").value == "a"
+    assert invocations == [0, 1]
+
+
+def test_memoized_failures_are_replayed():
+    failing, invocations = counting_parser(fail("error"))
+    failing = memoized(failing)
+    parser = choice(
+        try_parser(failing),
+        choice(try_parser(failing), unit("fallback")),
+    )
+    assert run_parser(parser, "").value == "fallback"
+    assert invocations == [0]
+
+
+def test_memoized_parser_can_be_reused_on_different_inputs():
+    parser = memoized(choice(literal("a"), literal("b")))
+    assert run_parser(parser, "a").value == "a"
+    assert run_parser(parser, "b").value == "b"
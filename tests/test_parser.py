@@ -187,6 +187,18 @@ def test_none_of_raises_ParsingFailed_when_encountering_forbidden_char(runner):
         runner(p, "a")
 
 
+def test_many_none_of_consumes_up_to_the_first_forbidden_char(runner):
+    p = many(none_of(","))
+    result = runner(p, "abc,def")
+    assert result.value == ["a", "b", "c"]
+    assert result.remaining_input == ",def"
+
+
+def test_many_none_of_with_empty_forbidden_set_consumes_everything(runner):
+    p = many(none_of(""))
+    assert runner(p, "ab\ncd").value == ["a", "b", "\n", "c", "d"]
+
+
 def test_none_of_raises_ParsingFailed_when_nothing_to_consume(runner):
     p = none_of("a")
     with pytest.raises(ParsingFailed):
@@ -372,6 +384,21 @@ def test_choices(runner):
     assert runner(choices(literal("a"), literal("b"), literal("c")), "b").value == "b"
 
 
+def test_choices_of_literals_respects_the_given_order(runner):
+    p = choices(literal("a"), literal("ab"))
+    assert runner(p, "ab").remaining_input == "b"
+
+
+def test_failing_choices_of_literals_reports_all_alternatives():
+    p = choices(literal("first"), literal("second"), literal("third"))
+    with pytest.raises(ParsingFailed) as err:
+        run_parser(p, "xxxxxxxxxx")
+    error_message = str(err.value)
+    assert "first" in error_message
+    assert "second" in error_message
+    assert "third" in error_message
+
+
 def test_whitespace_parses_regular_space_character(runner):
     assert runner(whitespace, "\u0020").value == "\u0020"
 